@@ -1,11 +1,15 @@
-from fastapi import FastAPI, HTTPException, Query, status
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import HTMLResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-import json
-import os
+from pydantic import BaseModel, ConfigDict, Field
+import asyncio
+import bisect
+import collections
+import itertools
+import orjson
+import sqlite3
 import threading
-from typing import Optional, List
+from typing import Optional
 from prometheus_fastapi_instrumentator import Instrumentator
 
 import logging
@@ -14,7 +18,14 @@ from os import getenv
 from fastapi import Request
 from logging_loki import LokiHandler
 
-app = FastAPI()
+# orjson 직렬화 응답 (fastapi.responses.ORJSONResponse 는 deprecated 라 직접 정의)
+class ORJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Prometheus 메트릭스 엔드포인트 (/metrics)
 Instrumentator().instrument(app).expose(app, endpoint="/metrics")
@@ -61,146 +72,498 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 기존
-# class TodoItem(BaseModel):
-#     id: Optional[int] = Field(None, description="미지정 시 자동 할당")
-#     title: str = Field(..., min_length=1)
-#     description: str = ""
-#     completed: bool = False
-
-# 변경 (모두 필수)
+# To-Do 항목 (모두 필수)
 class TodoItem(BaseModel):
-    id: int
+    # 입력 검증 전용 (model_dump() 한 번으로 저장/응답 모두 사용), 모르는 필드는 422
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    # SQLite INTEGER(64비트) 범위 밖 id 는 저장 시점이 아니라 요청에서 422
+    id: int = Field(..., ge=-2**63, le=2**63 - 1)
     title: str
     description: str
     completed: bool
 
 # 부분수정용 모델 (PATCH)
 class TodoPatch(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: Optional[str] = Field(None, min_length=1)
     description: Optional[str] = None
     completed: Optional[bool] = None
 
-# JSON 파일 경로
+# SQLite DB 경로 (WAL 모드, 행 단위 읽기/쓰기)
+TODO_DB = "todos.db"
+
+# 예전 JSON 저장소 (DB 최초 생성 시 1회 이관)
 TODO_FILE = "todos.json"
 
-# 간단 파일 락 (동시 요청 시 꼬임 방지)
-_file_lock = threading.Lock()
+_COLUMNS = "id, title, description, completed"
 
-# JSON 파일에서 To-Do 항목 로드
-def load_todos() -> list:
-    if not os.path.exists(TODO_FILE):
-        # 파일 없으면 빈 배열로 생성
-        save_todos([])
-        return []
-    with open(TODO_FILE, "r", encoding="utf-8") as file:
+def _row_to_todo(row) -> dict:
+    return {"id": row[0], "title": row[1], "description": row[2], "completed": bool(row[3])}
+
+# 예전 todos.json 에는 "true"/"1" 같은 문자열 completed 값도 섞여 있음
+_TRUTHY = frozenset({"true", "1", "yes", "y", "t"})
+
+def _normalize_completed(v) -> bool:
+    if v.__class__ is bool:
+        # 대부분은 이미 bool (isinstance 의 MRO 탐색 생략)
+        return v
+    if isinstance(v, str):
+        return v.strip().lower() in _TRUTHY
+    if isinstance(v, (int, float)):
+        return v != 0
+    return False
+
+def _insert_rows(todos: list) -> None:
+    # 제너레이터로 넘겨 행 튜플 리스트를 따로 만들지 않음 (sqlite3 가 한 행씩 바인딩)
+    norm = _normalize_completed
+    _db.executemany(
+        f"INSERT OR REPLACE INTO todos ({_COLUMNS}) VALUES (?, ?, ?, ?)",
+        ((t["id"], t["title"], t["description"], int(norm(t["completed"]))) for t in todos),
+    )
+
+def _import_legacy_json() -> None:
+    # todos.json 이 남아 있으면 새로 만든 DB로 옮김
+    try:
+        with open(TODO_FILE, "rb") as file:
+            todos = orjson.loads(file.read())
+    except FileNotFoundError:
+        return
+    except orjson.JSONDecodeError as e:
+        custom_logger.warning("skipping unreadable %s: %s", TODO_FILE, e)
+        return
+    if not isinstance(todos, list):
+        custom_logger.warning("skipping %s: expected a list, got %s", TODO_FILE, type(todos).__name__)
+        return
+    rows = []
+    for t in todos:
+        # 빠진 필드는 예전 모델 기본값("")으로 채우고, id 없는 항목은 건너뜀
+        if not isinstance(t, dict) or not isinstance(t.get("id"), int):
+            custom_logger.warning("skipping malformed todo in %s: %r", TODO_FILE, t)
+            continue
+        rows.append({
+            "id": t["id"],
+            "title": t.get("title") or "",
+            "description": t.get("description") or "",
+            "completed": t.get("completed", False),
+        })
+    _insert_rows(rows)
+
+def _open_db() -> sqlite3.Connection:
+    # 모듈 로드 시 한 번만 연결 (autocommit, 스레드 간 공유)
+    conn = sqlite3.connect(TODO_DB, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def _init_schema() -> None:
+    # 테이블 생성 + JSON 이관을 한 트랜잭션으로 처리
+    # (중간에 죽으면 통째로 롤백되어 다음 기동 때 이관을 다시 시도)
+    _db.execute("BEGIN IMMEDIATE")
+    try:
+        is_new_db = _db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='todos'"
+        ).fetchone() is None
+        if is_new_db:
+            _db.execute(
+                "CREATE TABLE todos ("
+                "id INTEGER PRIMARY KEY, title TEXT NOT NULL, description TEXT NOT NULL, completed INTEGER NOT NULL)"
+            )
+            _import_legacy_json()
+    except Exception:
+        _db.execute("ROLLBACK")
+        raise
+    _db.execute("COMMIT")
+
+_db = _open_db()
+_init_schema()
+
+# 메모리 캐시: id → 항목 (읽기는 DB를 거치지 않음, O(1) 조회/삭제)
+# DB 를 다시 읽을 때와 같은 순서가 되도록 항상 id 순으로 유지
+_cache: Optional[dict] = None
+# 캐시 적재 시점의 PRAGMA data_version (다른 연결이 DB를 바꾸면 값이 달라짐)
+_cache_data_version = 0
+# 검색용 소문자 제목+설명 (id → 문자열, 요청마다 lower() 하지 않도록 미리 계산)
+_search_text: dict = {}
+# 검색 blob: _search_text 를 b"\x1f" 로 이어 붙인 bytes + 각 행 시작 위치 + id
+# (bytes.find 한 번의 C 레벨 스캔으로 검색, 변경 시 None 으로 두고 다음 검색 때 다시 만듦)
+_search_blob: Optional[tuple] = None
+# GET /todos 직렬화 결과 캐시 ((completed, q, limit, offset) → JSON bytes), 변경 시 비움
+# 최근에 쓴 항목이 뒤로 가는 LRU, 개수와 전체 바이트 수 둘 다 제한
+_resp_cache: dict = {}
+_resp_cache_bytes = 0
+RESP_CACHE_MAX = 256
+RESP_CACHE_MAX_BYTES = 8 * 1024 * 1024
+# 이보다 큰 응답은 캐시하지 않음
+RESP_CACHE_MAX_BODY = 512 * 1024
+# 완료된 항목 수 (통계용, 변경 시 증감 / 전체 수는 len(_cache))
+_completed_count = 0
+# 마지막 flush 이후 바뀐 id (캐시에 있으면 upsert, 없으면 delete)
+_dirty: set = set()
+# 스냅샷은 떴지만 아직 커밋되지 않은 (upserts, deletes) 묶음, 오래된 것부터 (_tx_lock 아래에서 비움)
+_pending_writes: collections.deque = collections.deque()
+
+# 첫 변경 후 flush 까지 기다리는 시간 (초) - 그 사이 들어온 변경을 한 번에 묶음
+FLUSH_DELAY = 0.05
+# 쓰기가 계속 실패할 때 재시도 간격 상한 (실패마다 두 배, 성공하면 FLUSH_DELAY 로 복귀)
+FLUSH_RETRY_MAX = 5.0
+# writer 깨우기 신호 큐 (startup 에서 생성, 대기 중인 신호는 최대 1개)
+_write_queue: Optional[asyncio.Queue] = None
+
+def _data_version() -> int:
+    return _db.execute("PRAGMA data_version").fetchone()[0]
+
+# 연결 하나를 flush 스레드와 공유하므로 쓰기 트랜잭션이 겹치지 않게 막음
+_tx_lock = threading.Lock()
+
+# 특정 행의 값 때문에 나는 오류 (그 행만 버리고 나머지는 저장)
+_BAD_ROW_ERRORS = (UnicodeEncodeError, OverflowError, sqlite3.IntegrityError)
+
+def _write_batch(upserts: list, deletes: list) -> None:
+    _db.execute("BEGIN")
+    try:
+        _insert_rows(upserts)
+        _db.executemany("DELETE FROM todos WHERE id = ?", ((i,) for i in deletes))
+    except Exception:
+        _db.execute("ROLLBACK")
+        raise
+    _db.execute("COMMIT")
+
+def _write_changes(upserts: list, deletes: list) -> None:
+    try:
+        _write_batch(upserts, deletes)
+    except _BAD_ROW_ERRORS:
+        # 문제 행 하나가 배치 전체를 막지 않도록 한 행씩 다시 씀
+        for t in upserts:
+            try:
+                _write_batch([t], [])
+            except _BAD_ROW_ERRORS:
+                custom_logger.exception("dropping todo %r that cannot be stored", t["id"])
+        _write_batch([], deletes)
+
+def _queue_changes() -> None:
+    # 이벤트 루프 스레드에서 변경분 스냅샷을 뜸 (이후 핸들러가 캐시를 바꿔도 안전)
+    global _dirty
+    if not _dirty:
+        return
+    ids, _dirty = _dirty, set()
+    upserts = [dict(_cache[i]) for i in ids if i in _cache]
+    deletes = [i for i in ids if i not in _cache]
+    _pending_writes.append((upserts, deletes))
+
+def _write_pending() -> None:
+    # 쌓인 스냅샷을 순서대로 커밋 (실패하면 남겨 두고 다음에 다시 시도)
+    with _tx_lock:
+        while _pending_writes:
+            _write_changes(*_pending_writes[0])
+            _pending_writes.popleft()
+
+# 쌓인 변경분을 DB에 반영
+async def flush_todos() -> None:
+    _queue_changes()
+    if _pending_writes:
+        await asyncio.to_thread(_write_pending)
+
+def _notify_writer() -> None:
+    if _write_queue is not None and _write_queue.empty():
+        _write_queue.put_nowait(None)
+
+# 변경이 있을 때만 깨어나 모아서 쓰는 writer (요청은 디스크를 기다리지 않음)
+async def _writer() -> None:
+    delay = FLUSH_DELAY
+    while True:
+        await _write_queue.get()
+        await asyncio.sleep(delay)
+        while not _write_queue.empty():
+            _write_queue.get_nowait()
         try:
-            return json.load(file)
-        except json.JSONDecodeError:
-            # 깨진 파일 대비
-            return []
+            await flush_todos()
+        except Exception:
+            custom_logger.exception("todos flush failed")
+            delay = min(delay * 2, FLUSH_RETRY_MAX)
+            _notify_writer()
+        else:
+            delay = FLUSH_DELAY
+
+# 캐시 로드 (외부에서 DB가 바뀌었을 때만 다시 읽음)
+def _load_cache() -> dict:
+    global _cache, _cache_data_version
+    version = _data_version()
+    if _cache is not None and version == _cache_data_version:
+        return _cache
+    if _cache is not None and (_dirty or _pending_writes):
+        # 외부 변경과 겹쳤지만 아직 안 쓴 변경분이 있음 → 이벤트 루프에서 쓰지 않고
+        # 지금 캐시로 응답, writer 가 커밋한 뒤의 요청에서 다시 읽음
+        _notify_writer()
+        return _cache
+    rows = _db.execute(f"SELECT {_COLUMNS} FROM todos ORDER BY id").fetchall()
+    _cache = {r[0]: _row_to_todo(r) for r in rows}
+    _cache_data_version = version
+    _rebuild_search()
+    _reset_counters()
+    _clear_resp_cache()
+    return _cache
+
+# 전체 To-Do 항목 로드
+def load_todos() -> list:
+    return list(_load_cache().values())
 
-# JSON 파일에 To-Do 항목 저장
+# 전체 To-Do 항목 교체 저장 (한 트랜잭션, 즉시 반영)
 def save_todos(todos: list) -> None:
-    with open(TODO_FILE, "w", encoding="utf-8") as file:
-        json.dump(todos, file, indent=4, ensure_ascii=False)
+    global _cache, _cache_data_version
+    with _tx_lock:
+        _db.execute("BEGIN")
+        try:
+            _db.execute("DELETE FROM todos")
+            _insert_rows(todos)
+        except Exception:
+            _db.execute("ROLLBACK")
+            raise
+        _db.execute("COMMIT")
+        _pending_writes.clear()
+    norm = _normalize_completed
+    _cache = {t["id"]: {**t, "completed": norm(t["completed"])} for t in sorted(todos, key=lambda t: t["id"])}
+    _cache_data_version = _data_version()
+    _rebuild_search()
+    _reset_counters()
+    _clear_resp_cache()
+    _dirty.clear()
+
+def _search_key(t: dict) -> str:
+    return (t["title"] + "\x00" + t["description"]).lower()
+
+def _index_search(t: dict) -> None:
+    global _search_blob
+    _search_text[t["id"]] = _search_key(t)
+    _search_blob = None
+
+def _unindex_search(todo_id: int) -> None:
+    global _search_blob
+    del _search_text[todo_id]
+    _search_blob = None
+
+def _rebuild_search() -> None:
+    global _search_text, _search_blob
+    _search_text = {i: _search_key(t) for i, t in _cache.items()}
+    _search_blob = None
+
+def _build_search_blob() -> tuple:
+    ids = list(_search_text)
+    parts = [_search_text[i].encode("utf-8") for i in ids]
+    starts = []
+    pos = 0
+    for part in parts:
+        starts.append(pos)
+        pos += len(part) + 1
+    return b"\x1f".join(parts), starts, ids
+
+def _search_matches(needle: bytes):
+    # 검색어가 들어 있는 행의 id 를 캐시 순서대로 하나씩 돌려줌
+    global _search_blob
+    if _search_blob is None:
+        _search_blob = _build_search_blob()
+    blob, starts, ids = _search_blob
+    last = len(starts) - 1
+    pos = blob.find(needle)
+    while pos != -1:
+        i = bisect.bisect_right(starts, pos) - 1
+        row_end = starts[i + 1] - 1 if i < last else len(blob)
+        if pos + len(needle) <= row_end:
+            yield ids[i]
+            # 같은 행의 다른 위치는 건너뛰고 다음 행부터
+            pos = blob.find(needle, row_end + 1)
+        else:
+            # 구분자를 넘어 두 행에 걸친 일치는 버림
+            pos = blob.find(needle, pos + 1)
+
+# 캐시에 넣기 전에 먼저 직렬화 (인코딩 안 되는 값이 캐시/DB에 남지 않게)
+def _dump_todo(data: dict) -> bytes:
+    try:
+        return orjson.dumps(data)
+    except orjson.JSONEncodeError:
+        raise HTTPException(status_code=422, detail="To-Do item contains values that cannot be stored")
+
+def _resort_cache() -> None:
+    # 기존 최대 id 보다 작은 새 id 가 들어왔을 때만 (드묾) 다시 id 순으로 정렬
+    global _search_text, _search_blob
+    items = sorted(_cache.items())
+    _cache.clear()
+    _cache.update(items)
+    # 검색 텍스트는 다시 만들지 않고 순서만 캐시에 맞춤
+    _search_text = {i: _search_text[i] for i in _cache}
+    _search_blob = None
 
-def next_id(todos: list) -> int:
-    # 자동 id 발급 (빈 리스트면 1부터)
-    return (max((t["id"] for t in todos if "id" in t and t["id"] is not None), default=0) + 1)
+def _clear_resp_cache() -> None:
+    global _resp_cache_bytes
+    _resp_cache.clear()
+    _resp_cache_bytes = 0
+
+def _cache_response(key: tuple, body: bytes) -> None:
+    global _resp_cache_bytes
+    if len(body) > RESP_CACHE_MAX_BODY:
+        return
+    # 가장 오래 안 쓴 항목부터 버림
+    while _resp_cache and (
+        len(_resp_cache) >= RESP_CACHE_MAX or _resp_cache_bytes + len(body) > RESP_CACHE_MAX_BYTES
+    ):
+        _resp_cache_bytes -= len(_resp_cache.pop(next(iter(_resp_cache))))
+    _resp_cache[key] = body
+    _resp_cache_bytes += len(body)
+
+def _mark_dirty(todo_id: int) -> None:
+    _dirty.add(todo_id)
+    _clear_resp_cache()
+    _notify_writer()
+
+def _reset_counters() -> None:
+    global _completed_count
+    _completed_count = sum(1 for t in _cache.values() if t["completed"])
+
+@app.on_event("startup")
+async def start_writer():
+    global _write_queue
+    _write_queue = asyncio.Queue()
+    app.state.writer_task = asyncio.create_task(_writer())
+    if _dirty or _pending_writes:
+        _notify_writer()
+
+@app.on_event("shutdown")
+async def stop_writer():
+    app.state.writer_task.cancel()
+    await flush_todos()
+
+# 메인 페이지는 정적 파일이라 모듈 로드 시 한 번만 읽음
+INDEX_HTML_PATH = "templates/index.html"
+
+def _read_index_html() -> bytes:
+    try:
+        with open(INDEX_HTML_PATH, "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        return "<h1>templates/index.html 없음</h1>".encode("utf-8")
+
+_INDEX_HTML = _read_index_html()
+
+# DEV 환경변수가 있으면 매 요청마다 다시 읽어 템플릿 수정을 바로 반영
+_DEV = bool(getenv("DEV"))
+
+# 항상 같은 내용인 응답은 미리 직렬화해 둠
+_HEALTH_BODY = orjson.dumps({"status": "ok"})
+_DELETED_BODY = orjson.dumps({"message": "To-Do item deleted"})
 
 # 건강 상태 체크
 @app.get("/health")
-def health():
-    return {"status": "ok"}
+async def health():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 # To-Do 목록 조회 + 필터/검색
-@app.get("/todos", response_model=List[TodoItem])
-def get_todos(
+# 저장된 데이터는 이미 스키마를 만족하므로 response_model 검증 없이 바로 직렬화
+@app.get("/todos")
+async def get_todos(
     completed: Optional[bool] = Query(None, description="완료여부 필터"),
     q: Optional[str] = Query(None, description="제목/설명 검색(부분일치)"),
     limit: int = Query(1000, ge=1, le=10000, description="최대 반환 개수"),
     offset: int = Query(0, ge=0, description="건너뛸 개수"),
 ):
-    todos = load_todos()
-    if completed is not None:
-        todos = [t for t in todos if t.get("completed") is completed]
+    cache = _load_cache()
+    key = (completed, q, limit, offset)
+    body = _resp_cache.pop(key, None)
+    if body is not None:
+        # 맨 뒤로 옮겨 자주 쓰는 조회가 먼저 밀려나지 않게 함
+        _resp_cache[key] = body
+        return Response(content=body, media_type="application/json")
+    # 필터는 제너레이터로 이어 붙여 offset + limit 개를 채우면 바로 멈춤 (중간 리스트 없음)
     if q:
-        q_low = q.lower()
-        todos = [
-            t for t in todos
-            if q_low in t.get("title", "").lower() or q_low in t.get("description", "").lower()
-        ]
-    return todos[offset: offset + limit]
+        todos = (cache[i] for i in _search_matches(q.lower().encode("utf-8")))
+    else:
+        todos = cache.values()
+    if completed is not None:
+        todos = (t for t in todos if t["completed"] is completed)
+    body = orjson.dumps(list(itertools.islice(todos, offset, offset + limit)))
+    _cache_response(key, body)
+    return Response(content=body, media_type="application/json")
 
+# 핸들러는 캐시만 바꾸고 await 하지 않으므로 요청 간 락이 필요 없음 (DB 쓰기는 writer 가 모아서 처리)
 # 변경 (status 기본 200, 자동 ID 없음 / 중복 체크도 빼서 원래 심플 로직과 동일)
+# 같은 id 가 이미 있으면 덮어씀 (id 가 PRIMARY KEY 라 중복 저장은 불가)
 @app.post("/todos", response_model=TodoItem)   # 200 유지 (테스트 기대)
-def create_todo(todo: TodoItem):
-    with _file_lock:
-        todos = load_todos()
-        data = todo.model_dump()
-        if data.get("id") is None:
-            data["id"] = next_id(todos)
-        todos.append(data)
-        save_todos(todos)
-    return data
+async def create_todo(todo: TodoItem):
+    global _completed_count
+    todos = _load_cache()
+    data = todo.model_dump()
+    body = _dump_todo(data)
+    old = todos.get(data["id"])
+    if old is not None:
+        _completed_count -= old["completed"]
+    last_id = next(reversed(todos), None)
+    todos[data["id"]] = data
+    _completed_count += data["completed"]
+    _index_search(data)
+    if old is None and last_id is not None and data["id"] < last_id:
+        _resort_cache()
+    _mark_dirty(data["id"])
+    return Response(content=body, media_type="application/json")
 
 # To-Do 항목 수정(전체 교체)
 @app.put("/todos/{todo_id}", response_model=TodoItem)
-def update_todo(todo_id: int, updated_todo: TodoItem):
-    with _file_lock:
-        todos = load_todos()
-        for i, t in enumerate(todos):
-            if t["id"] == todo_id:
-                # URL의 id가 우선
-                data = updated_todo.model_dump()
-                data["id"] = todo_id
-                todos[i] = data
-                save_todos(todos)
-                return data
-    raise HTTPException(status_code=404, detail="To-Do item not found")
+async def update_todo(todo_id: int, updated_todo: TodoItem):
+    global _completed_count
+    todos = _load_cache()
+    if todo_id not in todos:
+        raise HTTPException(status_code=404, detail="To-Do item not found")
+    # URL의 id가 우선
+    data = updated_todo.model_dump()
+    data["id"] = todo_id
+    body = _dump_todo(data)
+    _completed_count += data["completed"] - todos[todo_id]["completed"]
+    todos[todo_id] = data
+    _index_search(data)
+    _mark_dirty(todo_id)
+    return Response(content=body, media_type="application/json")
 
 # To-Do 항목 부분 수정(PATCH)
 @app.patch("/todos/{todo_id}", response_model=TodoItem)
-def patch_todo(todo_id: int, patch: TodoPatch):
-    with _file_lock:
-        todos = load_todos()
-        for i, t in enumerate(todos):
-            if t["id"] == todo_id:
-                if patch.title is not None:
-                    t["title"] = patch.title
-                if patch.description is not None:
-                    t["description"] = patch.description
-                if patch.completed is not None:
-                    t["completed"] = patch.completed
-                todos[i] = t
-                save_todos(todos)
-                return t
-    raise HTTPException(status_code=404, detail="To-Do item not found")
+async def patch_todo(todo_id: int, patch: TodoPatch):
+    global _completed_count
+    todos = _load_cache()
+    old = todos.get(todo_id)
+    if old is None:
+        raise HTTPException(status_code=404, detail="To-Do item not found")
+    t = dict(old)
+    if patch.title is not None:
+        t["title"] = patch.title
+    if patch.description is not None:
+        t["description"] = patch.description
+    if patch.completed is not None:
+        t["completed"] = patch.completed
+    body = _dump_todo(t)
+    _completed_count += t["completed"] - old["completed"]
+    todos[todo_id] = t
+    if patch.title is not None or patch.description is not None:
+        _index_search(t)
+    _mark_dirty(todo_id)
+    return Response(content=body, media_type="application/json")
 
 # To-Do 항목 삭제 (없으면 404)
-# 변경 (존재 여부와 상관없이 대상을 제외한 리스트 저장 → 200)
-@app.delete("/todos/{todo_id}", response_model=dict)
-def delete_todo(todo_id: int):
-    with _file_lock:
-        todos = load_todos()
-        todos = [t for t in todos if t.get("id") != todo_id]
-        save_todos(todos)
-    return {"message": "To-Do item deleted"}
+# 변경 (존재 여부와 상관없이 대상을 삭제 → 200)
+@app.delete("/todos/{todo_id}")
+async def delete_todo(todo_id: int):
+    global _completed_count
+    t = _load_cache().pop(todo_id, None)
+    if t is not None:
+        _completed_count -= t["completed"]
+        _unindex_search(todo_id)
+        _mark_dirty(todo_id)
+    return Response(content=_DELETED_BODY, media_type="application/json")
 
 # 간단 통계
-@app.get("/todos/_stats", response_model=dict)
-def todo_stats():
-    todos = load_todos()
-    total = len(todos)
-    done = sum(1 for t in todos if t.get("completed"))
-    return {"total": total, "completed": done, "pending": total - done}
+@app.get("/todos/_stats")
+async def todo_stats():
+    total = len(_load_cache())
+    return ORJSONResponse({"total": total, "completed": _completed_count, "pending": total - _completed_count})
 
 # HTML 파일 서빙
 @app.get("/", response_class=HTMLResponse)
-def read_root():
-    if not os.path.exists("templates/index.html"):
-        return HTMLResponse(content="<h1>templates/index.html 없음</h1>", status_code=200)
-    with open("templates/index.html", "r", encoding="utf-8") as file:
-        content = file.read()
-    return HTMLResponse(content=content)
+async def read_root():
+    return HTMLResponse(content=_read_index_html() if _DEV else _INDEX_HTML)
@@ -3,9 +3,13 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import asyncio
+import sqlite3
+
 import pytest
 from fastapi.testclient import TestClient
-from main import app, save_todos, load_todos, TodoItem
+import main
+from main import app, save_todos, load_todos, flush_todos, TodoItem
 
 client = TestClient(app)
 
@@ -38,6 +42,36 @@ def test_get_todos_empty():
 
 
 # ---------- 생성/조회 ----------
+def test_legacy_completed_values_are_normalized():
+    save_todos([
+        {"id": 1, "title": "a", "description": "", "completed": "true"},
+        {"id": 2, "title": "b", "description": "", "completed": " No "},
+        {"id": 3, "title": "c", "description": "", "completed": 1},
+    ])
+    assert [t["completed"] for t in client.get("/todos").json()] == [True, False, True]
+    assert client.get("/todos/_stats").json()["completed"] == 2
+
+
+def test_legacy_import_tolerates_missing_fields(tmp_path, monkeypatch):
+    legacy = tmp_path / "todos.json"
+    legacy.write_bytes(b'[{"id": 1, "title": "a", "completed": false}, {"title": "no id"}]')
+    monkeypatch.setattr(main, "TODO_FILE", str(legacy))
+    main._import_legacy_json()
+    rows = main._db.execute("SELECT id, title, description, completed FROM todos").fetchall()
+    assert rows == [(1, "a", "", 0)]
+
+
+def test_legacy_import_warns_on_unparsable_file(tmp_path, monkeypatch):
+    legacy = tmp_path / "todos.json"
+    legacy.write_bytes(b'[{"id": 1,')
+    monkeypatch.setattr(main, "TODO_FILE", str(legacy))
+    warnings = []
+    monkeypatch.setattr(main.custom_logger, "warning", lambda *a: warnings.append(a))
+    main._import_legacy_json()
+    assert len(warnings) == 1
+    assert main._db.execute("SELECT COUNT(*) FROM todos").fetchone() == (0,)
+
+
 def test_get_todos_with_items():
     todo = TodoItem(id=1, title="Test", description="Test description", completed=False)
     save_todos([todo.model_dump()])
@@ -66,6 +100,19 @@ def test_create_todo_invalid_422():
     assert r.status_code == 422
 
 
+def test_unknown_fields_rejected_422():
+    bad = {"id": 1, "title": "Test", "description": "", "completed": False, "priority": 1}
+    assert client.post("/todos", json=bad).status_code == 422
+    save_todos([TodoItem(id=1, title="T", description="", completed=False).model_dump()])
+    assert client.patch("/todos/1", json={"done": True}).status_code == 422
+
+
+def test_out_of_range_id_rejected_422():
+    bad = {"id": 2**63, "title": "T", "description": "", "completed": False}
+    assert client.post("/todos", json=bad).status_code == 422
+    assert client.get("/todos/_stats").json()["total"] == 0
+
+
 # ---------- 필터/검색/페이지 ----------
 def test_filter_completed_and_search_and_pagination():
     items = [
@@ -103,6 +150,46 @@ def test_filter_completed_and_search_and_pagination():
     assert data4[0]["id"] == 2 and data4[1]["id"] == 3
 
 
+def test_list_cache_invalidated_by_mutation():
+    save_todos([TodoItem(id=1, title="A", description="a", completed=False).model_dump()])
+    assert [t["completed"] for t in client.get("/todos").json()] == [False]
+    client.patch("/todos/1", json={"completed": True})
+    assert [t["completed"] for t in client.get("/todos").json()] == [True]
+
+
+def test_search_matches_within_single_item_only():
+    save_todos([
+        {"id": 1, "title": "우유 사기", "description": "ab", "completed": False},
+        {"id": 2, "title": "cd", "description": "Milk 우유", "completed": True},
+        {"id": 3, "title": "xyz", "description": "", "completed": False},
+    ])
+    assert [t["id"] for t in client.get("/todos", params={"q": "우유"}).json()] == [1, 2]
+    assert [t["id"] for t in client.get("/todos", params={"q": "MILK"}).json()] == [2]
+    # 이웃한 두 항목에 걸친 문자열은 일치로 치지 않음
+    assert client.get("/todos", params={"q": "b\x1fc"}).json() == []
+    assert [t["id"] for t in client.get("/todos", params={"q": "우유", "completed": "false"}).json()] == [1]
+
+
+def test_list_order_matches_db_reload_order():
+    client.post("/todos", json={"id": 10, "title": "b", "description": "", "completed": False})
+    client.post("/todos", json={"id": 5, "title": "a", "description": "", "completed": False})
+    assert [t["id"] for t in client.get("/todos").json()] == [5, 10]
+    assert [t["id"] for t in client.get("/todos?q=a").json()] == [5]
+    asyncio.run(flush_todos())
+    main._cache = None
+    assert [t["id"] for t in client.get("/todos").json()] == [5, 10]
+
+
+def test_list_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(main, "RESP_CACHE_MAX", 2)
+    save_todos([TodoItem(id=1, title="A", description="a", completed=False).model_dump()])
+    client.get("/todos?offset=0")
+    client.get("/todos?offset=1")
+    client.get("/todos?offset=0")  # 적중 → 최근 사용으로 갱신
+    client.get("/todos?offset=2")
+    assert {k[3] for k in main._resp_cache} == {0, 2}
+
+
 # ---------- PUT/PATCH ----------
 def test_update_todo_put_overwrites_and_forces_url_id():
     original = TodoItem(id=10, title="A", description="B", completed=False)
@@ -139,6 +226,27 @@ def test_patch_todo_partial_update_completed_and_title():
     assert r3.status_code == 404
 
 
+def test_search_reflects_patched_title():
+    save_todos([TodoItem(id=1, title="Buy milk", description="market", completed=False).model_dump()])
+    client.patch("/todos/1", json={"title": "Read book"})
+    assert client.get("/todos?q=buy").json() == []
+    assert [t["id"] for t in client.get("/todos?q=BOOK").json()] == [1]
+
+
+def test_stats_track_put_patch_and_delete():
+    save_todos([
+        TodoItem(id=1, title="a", description="", completed=False).model_dump(),
+        TodoItem(id=2, title="b", description="", completed=True).model_dump(),
+    ])
+    client.put("/todos/1", json={"id": 1, "title": "a", "description": "", "completed": True})
+    assert client.get("/todos/_stats").json() == {"total": 2, "completed": 2, "pending": 0}
+    client.patch("/todos/2", json={"completed": False})
+    client.patch("/todos/2", json={"completed": False})
+    assert client.get("/todos/_stats").json() == {"total": 2, "completed": 1, "pending": 1}
+    client.delete("/todos/1")
+    assert client.get("/todos/_stats").json() == {"total": 1, "completed": 0, "pending": 1}
+
+
 # ---------- DELETE ----------
 def test_delete_todo_existing_and_stats():
     item = TodoItem(id=1, title="X", description="Y", completed=False)
@@ -162,3 +270,65 @@ def test_delete_todo_not_found_is_still_200():
     r = client.delete("/todos/999")
     assert r.status_code == 200
     assert r.json()["message"] == "To-Do item deleted"
+
+
+def test_create_todo_same_id_replaces():
+    # JMeter 부하 테스트처럼 같은 id 로 여러 번 POST 해도 200
+    todo = {"id": 1, "title": "Test", "description": "Test description", "completed": False}
+    assert client.post("/todos", json=todo).status_code == 200
+    r = client.post("/todos", json={**todo, "title": "Again", "completed": True})
+    assert r.status_code == 200
+    assert [t["title"] for t in client.get("/todos").json()] == ["Again"]
+    assert client.get("/todos/_stats").json() == {"total": 1, "completed": 1, "pending": 0}
+
+
+def test_read_root_serves_index_html():
+    r = client.get("/")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/html")
+    assert "To-Do List" in r.text
+
+
+# ---------- 캐시 → DB flush ----------
+def test_flush_persists_cached_mutations():
+    client.post("/todos", json={"id": 1, "title": "A", "description": "a", "completed": False})
+    client.post("/todos", json={"id": 2, "title": "B", "description": "b", "completed": False})
+    client.patch("/todos/1", json={"completed": True})
+    client.delete("/todos/2")
+    asyncio.run(flush_todos())
+
+    rows = main._db.execute("SELECT id, completed FROM todos").fetchall()
+    assert rows == [(1, 1)]
+
+
+def test_reload_keeps_snapshot_not_yet_committed():
+    client.post("/todos", json={"id": 1, "title": "A", "description": "a", "completed": False})
+    # flush 가 스냅샷만 뜨고 아직 커밋하지 못한 상태
+    main._queue_changes()
+    # 그 사이 다른 연결이 DB를 바꿈 → 다음 요청에서 캐시 재적재
+    other = sqlite3.connect(main.TODO_DB)
+    other.execute("INSERT INTO todos VALUES (2, 'B', 'b', 0)")
+    other.commit()
+    other.close()
+
+    # 안 쓴 변경분이 남아 있는 동안은 기존 캐시로 응답 (요청 안에서 DB에 쓰지 않음)
+    assert [t["id"] for t in client.get("/todos").json()] == [1]
+    asyncio.run(flush_todos())
+    assert [t["id"] for t in client.get("/todos").json()] == [1, 2]
+    assert main._db.execute("SELECT id FROM todos ORDER BY id").fetchall() == [(1,), (2,)]
+
+
+def test_unencodable_text_rejected_and_does_not_block_flush():
+    # 짝 없는 surrogate 는 JSON 으로는 파싱되지만 UTF-8 로 저장/직렬화할 수 없음
+    bad = b'{"id": 1, "title": "\\ud800", "description": "", "completed": false}'
+    r = client.post("/todos", content=bad, headers={"Content-Type": "application/json"})
+    assert r.status_code == 422
+    assert client.get("/todos").json() == []
+    assert client.get("/todos?q=a").status_code == 200
+
+    client.post("/todos", json={"id": 2, "title": "ok", "description": "", "completed": False})
+    # 캐시에 직접 들어간 문제 행이 있어도 나머지 행은 저장됨
+    main._cache[3] = {"id": 3, "title": "\ud800", "description": "", "completed": False}
+    main._dirty.add(3)
+    asyncio.run(flush_todos())
+    assert main._db.execute("SELECT id FROM todos").fetchall() == [(2,)]